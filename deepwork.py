@@ -1,225 +1,600 @@
-import argparse 
 import json 
-from datetime import datetime, timedelta 
-import csv 
+import math
+import os
+from datetime import date, datetime, timedelta 
 import time 
-import matplotlib.pyplot as plt 
-from collections import defaultdict 
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+#numpy is optional; without it sessions are kept in plain lists
+try:
+   import numpy as np
+except ImportError:
+   np = None
+
+try:
+   import orjson
+   _dumps = orjson.dumps
+   _loads = orjson.loads
+except ImportError:
+   def _dumps(obj):
+      return json.dumps(obj, separators=(',', ':')).encode()
+   _loads = json.loads
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+#row layout of the binary session cache
+_CACHE_DTYPE = [('start_day', '<i8'), ('duration', '<f8'), ('code', '<i4')]
+
+def _summarize_loop(durations, codes, num_categories):
+   #fused group + sum, compiled with numba when it is installed
+   category_time = np.zeros(num_categories)
+   category_count = np.zeros(num_categories, dtype=np.int64)
+   total_time = 0.0
+   for i in range(len(durations)):
+      total_time += durations[i]
+      category_time[codes[i]] += durations[i]
+      category_count[codes[i]] += 1
+   return total_time, category_time, category_count
+
+def _summarize_numpy(durations, codes, num_categories):
+   category_time = np.bincount(codes, weights=durations, minlength=num_categories)
+   category_count = np.bincount(codes, minlength=num_categories)
+   return float(durations.sum()), category_time, category_count
+
+def _summarize_python(durations, codes, num_categories):
+   #codes are dense small ints, so plain lists indexed by code replace any dict keyed by category
+   category_time = [0.0] * num_categories
+   category_count = [0] * num_categories
+   total_time = 0.0
+   for duration, code in zip(durations, codes):
+      total_time += duration
+      category_time[code] += duration
+      category_count[code] += 1
+   return total_time, category_time, category_count
+
+#importing numba costs far more than bincount over a few thousand rows, so the jitted
+#kernel only pays off for very large windows
+_NUMBA_MIN_ROWS = 100_000
+_jitted_summarize = None
+
+def _get_jitted_summarize():
+   global _jitted_summarize
+   if _jitted_summarize is None:
+      try:
+         from numba import njit
+      except ImportError:
+         _jitted_summarize = False
+      else:
+         _jitted_summarize = njit(cache=True)(_summarize_loop)
+   return _jitted_summarize
+
+def _summarize(durations, codes, num_categories):
+   if np is None:
+      return _summarize_python(durations, codes, num_categories)
+   if len(durations) > _NUMBA_MIN_ROWS:
+      kernel = _get_jitted_summarize()
+      if kernel:
+         return kernel(durations, codes, num_categories)
+   return _summarize_numpy(durations, codes, num_categories)
+
+def _search(column, value, side='left'):
+   if np is not None:
+      return int(np.searchsorted(column, value, side=side))
+   return (bisect_left if side == 'left' else bisect_right)(column, value)
+
+def _insert(column, index, value):
+   if np is not None:
+      return np.insert(column, index, value)
+   column.insert(index, value)
+   return column
 
 class DeepWorkTracker:
    def __init__(self, filename='deep_work_data.json'):
       self.filename = filename 
+      base, _ = os.path.splitext(filename)
+      #sessions live in an append-only JSON-lines log next to the goals file
+      self.sessions_filename = base + '.jsonl'
+      #binary snapshot of the session columns, so most commands never parse the log
+      self.cache_filename = base + '.cache.npy'
+      self.cache_meta_filename = base + '.cache.json'
+      self._sessions = None
       self.data = self.load_data() 
    
    def load_data(self):
       try:
-         with open(self.filename, 'r') as f:
-            return json.load(f)
+         with open(self.filename, 'rb') as f:
+            data = _loads(f.read())
       except FileNotFoundError: 
-         return {"sessions": [], "goals": {}} 
+         data = {"goals": {}} 
+      legacy_sessions = data.pop('sessions', None)
+      if legacy_sessions is not None and not os.path.exists(self.sessions_filename):
+         #move sessions out of the old single-file layout into the log; the log has to be complete
+         #before the sessions are dropped from the JSON file, so it's written atomically too
+         self._write_atomic(self.sessions_filename, b''.join(_dumps(session) + b'\n' for session in legacy_sessions))
+         self._write_atomic(self.filename, _dumps(data))
+
+      #fix up the log's tail before the cache key is taken from its size and mtime
+      self._repair_log_tail()
+      if not self._load_cache():
+         self._build_arrays(self.get_sessions())
+         self._save_cache()
+      #goals stay keyed by name on disk, but are looked up by category code in memory
+      self._goal_hours = {self._category_code(category): hours for category, hours in data['goals'].items()}
+      return data
+
+   def get_sessions(self):
+      #full session records are only parsed from the log when a command actually needs them
+      if self._sessions is None:
+         self._sessions = []
+         try:
+            with open(self.sessions_filename, 'rb') as f:
+               for line in f.read().splitlines():
+                  if line.strip():
+                     self._sessions.append(_loads(line))
+         except FileNotFoundError:
+            pass
+      return self._sessions
+
+   def _repair_log_tail(self):
+      #every complete record ends in a newline, so a log that doesn't is either a write cut short
+      #or a hand edit; only the last line is read, not the whole log
+      try:
+         f = open(self.sessions_filename, 'r+b')
+      except FileNotFoundError:
+         return
+      with f:
+         size = f.seek(0, os.SEEK_END)
+         if not size:
+            return
+         f.seek(size - 1)
+         if f.read(1) == b'\n':
+            return
+         start = size
+         while start > 0:
+            block_start = max(0, start - (1 << 16))
+            f.seek(block_start)
+            newline = f.read(start - block_start).rfind(b'\n')
+            if newline != -1:
+               start = block_start + newline + 1
+               break
+            start = block_start
+         f.seek(start)
+         last_line = f.read()
+         try:
+            _loads(last_line)
+         except ValueError:
+            #a partial record from a write killed mid-line; drop it so the next append starts clean
+            f.truncate(start)
+         else:
+            #a complete record that only lost its newline; keep it and terminate the line
+            f.seek(size)
+            f.write(b'\n')
+
+   def _build_arrays(self, sessions):
+      #struct-of-arrays copy of the sessions, so summaries reduce over flat columns instead of dicts;
+      #start dates are stored as int day numbers (days since 1970-01-01)
+      self._cat_to_id = {}
+      self._id_to_cat = []
+      self._cat_totals = []
+      self._cat_counts = []
+      codes = [self._category_code(s['category']) for s in sessions]
+      #durations are recomputed from the timestamps rather than read back from the rounded 'duration' field,
+      #so totals don't pick up rounding drift
+      if np is not None:
+         #numpy parses the whole column of ISO strings in one C loop
+         starts = np.array([s['start_time'] for s in sessions], dtype='datetime64[us]')
+         ends = np.array([s['end_time'] for s in sessions], dtype='datetime64[us]')
+         self._start_days = starts.astype('datetime64[D]').view(np.int64)
+         self._durations = (ends - starts) / np.timedelta64(1, 'h')
+         self._codes = np.array(codes, dtype=np.int32)
+      else:
+         starts = [datetime.fromisoformat(s['start_time']) for s in sessions]
+         ends = [datetime.fromisoformat(s['end_time']) for s in sessions]
+         self._start_days = [start.toordinal() - _EPOCH_ORDINAL for start in starts]
+         self._durations = [(end - start).total_seconds() / 3600 for start, end in zip(starts, ends)]
+         self._codes = codes
+      self._sort_by_start_day()
+      self._fold_totals()
+
+   def _sort_by_start_day(self):
+      #summaries binary-search the start days; the log is normally in start order already,
+      #but a clock stepped back (timezone change, NTP) can write a session out of order
+      if np is not None:
+         if np.all(self._start_days[1:] >= self._start_days[:-1]):
+            return
+         order = np.argsort(self._start_days, kind='stable')
+         self._start_days, self._durations, self._codes = self._start_days[order], self._durations[order], self._codes[order]
+      else:
+         if all(a <= b for a, b in zip(self._start_days, self._start_days[1:])):
+            return
+         order = sorted(range(len(self._start_days)), key=self._start_days.__getitem__)
+         self._start_days = [self._start_days[i] for i in order]
+         self._durations = [self._durations[i] for i in order]
+         self._codes = [self._codes[i] for i in order]
+
+   def _fold_totals(self):
+      #the all-time totals are folded once at load and then kept current by end_session
+      self._cat_order = None
+      self._weekly = None
+      if np is not None:
+         self._total_hours = float(self._durations.sum())
+         self._cat_totals = np.bincount(self._codes, weights=self._durations, minlength=len(self._id_to_cat)).tolist()
+         self._cat_counts = np.bincount(self._codes, minlength=len(self._id_to_cat)).tolist()
+      else:
+         self._total_hours = 0.0
+         self._cat_totals = [0.0] * len(self._id_to_cat)
+         self._cat_counts = [0] * len(self._id_to_cat)
+         for code, duration in zip(self._codes, self._durations):
+            self._total_hours += duration
+            self._cat_totals[code] += duration
+            self._cat_counts[code] += 1
+
+   def _log_key(self):
+      try:
+         stat = os.stat(self.sessions_filename)
+      except FileNotFoundError:
+         return None
+      return [stat.st_size, stat.st_mtime_ns]
+
+   def _load_cache(self):
+      if np is None:
+         return False
+      try:
+         with open(self.cache_meta_filename, 'rb') as f:
+            meta = _loads(f.read())
+         records = np.load(self.cache_filename, mmap_mode='r')
+         #the snapshot only counts if it was written against the log exactly as it is now
+         if meta['log'] != self._log_key() or meta['count'] != len(records):
+            return False
+         categories = meta['categories']
+      except (OSError, ValueError, KeyError, TypeError):
+         #the cache is disposable; anything unreadable or malformed just means rebuilding it
+         return False
+      if records.dtype != np.dtype(_CACHE_DTYPE):
+         return False
+      self._id_to_cat = categories
+      self._cat_to_id = {category: code for code, category in enumerate(self._id_to_cat)}
+      self._start_days = records['start_day']
+      self._durations = records['duration']
+      self._codes = records['code']
+      self._fold_totals()
+      return True
+
+   def _save_cache(self):
+      log_key = self._log_key()
+      if np is None or log_key is None:
+         return
+      records = np.empty(len(self._durations), dtype=_CACHE_DTYPE)
+      records['start_day'] = self._start_days
+      records['duration'] = self._durations
+      records['code'] = self._codes
+      #records first, metadata last: a crash in between leaves a stale key and the cache just gets rebuilt
+      tmp_filename = self.cache_filename + '.tmp'
+      with open(tmp_filename, 'wb') as f:
+         np.save(f, records)
+      os.replace(tmp_filename, self.cache_filename)
+      meta = {'log': log_key, 'count': len(records), 'categories': self._id_to_cat}
+      self._write_atomic(self.cache_meta_filename, _dumps(meta))
+
+   def _category_code(self, category):
+      #each category is encoded as a small int the first time it's seen, so grouping never hashes strings
+      code = self._cat_to_id.setdefault(category, len(self._id_to_cat))
+      if code == len(self._id_to_cat):
+         self._id_to_cat.append(category)
+         self._cat_totals.append(0.0)
+         self._cat_counts.append(0)
+         #anything sized by the old category count is stale now
+         self._cat_order = None
+         self._weekly = None
+      return code
+
+   def _category_order(self):
+      #category codes by all-time hours, largest first; shared by summaries and the chart,
+      #and only re-sorted after end_session has changed the totals
+      if self._cat_order is None:
+         self._cat_order = sorted(range(len(self._id_to_cat)), key=self._cat_totals.__getitem__, reverse=True)
+      return self._cat_order
       
-   def save_data(self):
-      with open(self.filename, 'w') as f:
-         json.dump(self.data, f, incident=2) 
+   def _append_session(self, session):
+      #one line per session, so ending a session costs O(1) instead of rewriting every session
+      with open(self.sessions_filename, 'ab') as f:
+         f.write(_dumps(session) + b'\n')
+
+   def save_goals(self):
+      self._write_atomic(self.filename, _dumps(self.data))
+
+   def _write_atomic(self, filename, payload):
+      #write-then-rename so a crash mid-write can't leave a truncated file
+      tmp_filename = filename + '.tmp'
+      with open(tmp_filename, 'wb') as f:
+         f.write(payload)
+      os.replace(tmp_filename, filename)
    
    def start_session(self, category): 
-      start_time = datetime.now().isoformat()
-      print("Deep work started at {start_time}")
-      return start_time, category 
+      start_dt = datetime.now()
+      start_time = start_dt.isoformat()
+      #remember the open session so a later 'end' invocation can close it
+      self.data['active'] = {'start_time': start_time, 'category': category}
+      self.save_goals()
+      print(f"Deep work started at {start_time}")
+      return start_dt, category 
    
-   def end_session(self, start_time, category, description):
-      end_time = datetime.now().isoformat()
-      duration = (datetime.fromisoformat(end_time) - datetime.fromisoformat(start_time)).total_seconds() / 3600
+   def end_session(self, start_dt, category, description):
+      #start_dt is a datetime; ISO strings are only produced for the stored record
+      end_dt = datetime.now()
+      duration = (end_dt - start_dt).total_seconds() / 3600
       session = {
-         'start_time': start_time,
-         'end_time': end_time, 
+         'start_time': start_dt.isoformat(),
+         'end_time': end_dt.isoformat(), 
          'duration': round(duration, 2),
          'category': category, 
          'description': description 
       }
-      self.data['sessions'].append(session) 
-      self.save_data() 
-      print("Session ended. Duration: {round(duration, 2)}hours")
+      if self._sessions is not None:
+         self._sessions.append(session) 
+      code = self._category_code(category)
+      start_day = start_dt.toordinal() - _EPOCH_ORDINAL
+      #keep the columns in start order for the binary search; this is the end unless the clock went back
+      position = _search(self._start_days, start_day, side='right')
+      self._durations = _insert(self._durations, position, duration)
+      self._start_days = _insert(self._start_days, position, start_day)
+      self._codes = _insert(self._codes, position, code)
+      self._total_hours += duration
+      self._cat_totals[code] += duration
+      self._cat_counts[code] += 1
+      self._cat_order = None
+      self._weekly = None
+      self._append_session(session) 
+      self._save_cache()
+      if self.data.pop('active', None) is not None:
+         self.save_goals()
+      print(f"Session ended. Duration: {round(duration, 2)} hours")
    
    def list_sessions(self):
-      for i, session in enumerate(self.data['sessions'], 1): 
-         print("Session {i}:")
-         print("Start: {session['start_time']}")
-         print("End: {session['end_time']}")
-         print("Duration: {session['duration']} hours") 
-         print("Category: {session['category]}") 
-         print("Description: {session['description']}")
+      for i, session in enumerate(self.get_sessions(), 1): 
+         print(f"Session {i}:")
+         print(f"Start: {session['start_time']}")
+         print(f"End: {session['end_time']}")
+         print(f"Duration: {session['duration']} hours") 
+         print(f"Category: {session['category']}") 
+         print(f"Description: {session['description']}")
          print()
    
    def get_total_time(self):
-      total_time = sum(session['duration'] for session in self.data['sessions']) 
-      return round(total_time, 2) 
+      return round(self._total_hours, 2) 
    
    def get_summary(self, period= 'all'):
+      now = datetime.now()
+      today = now.date()
       if period == 'daily':
-         start_date = datetime.now().date()
+         aggregates = self._reduce_from(today)
       elif period == 'weekly':
-         start_date = datetime.now().date()-timedelta(days=datetime.now().weekday())
+         aggregates = self._weekly_aggregates(today)
       else:
-         start_date = datetime.min.date() 
-      
-      filtered_sessions = [
-         session for session in self.data['sessions'] 
-         if datetime.fromisoformat(session['start_time']).date() >= start_date 
-      ]
-
-      total_time = sum(session['duration'] for session in filtered_sessions) 
-      category_time = defaultdict(float) 
-      for session in filtered_sessions:
-         category_time[session['category']] += session['duration']  
-      
+         #all-time figures are kept current by end_session, nothing to reduce
+         aggregates = self._total_hours, self._cat_totals, self._cat_counts
+      return self._format_summary(*aggregates)
+
+   def _reduce_from(self, start_date):
+      #sessions are stored in start order, so the ones in the period are the tail after a binary search
+      first = _search(self._start_days, start_date.toordinal() - _EPOCH_ORDINAL)
+      return _summarize(self._durations[first:], self._codes[first:], len(self._id_to_cat))
+
+   def _weekly_aggregates(self, today):
+      #raw totals for the current week, shared by the weekly summary, goal tracking and the score;
+      #dropped when end_session adds a session and recomputed when the week rolls over
+      week_start = today - timedelta(days=today.weekday())
+      if self._weekly is None or self._weekly[0] != week_start:
+         self._weekly = week_start, self._reduce_from(week_start)
+      return self._weekly[1]
+
+   def _format_summary(self, total_time, category_time, category_count):
       return  {
-         'total_time': round(total_time, 2),
-         'category_time': {k: round(v, 2) for k, v in category_time.items()}, 
-         'num_sessions': len(filtered_sessions) 
+         'total_time': round(float(total_time), 2),
+         'category_time': {
+            self._id_to_cat[i]: round(float(category_time[i]), 2)
+            for i in self._category_order() if category_count[i]
+         }, 
+         'num_sessions': int(sum(category_count)) 
       }
    
    def  export_to_csv(self, filename):
-      with open(filename, 'w', newline='') as csvfile: 
-         fieldnames = ['start_time', 'end_time', 'duration', 'category', 'description']
-         writer = csv.DictWriter(csvfile, fieldnames=fieldnames) 
-         writer.writeheader()
-         for session in self.data['sessions']:  
-            writer.writerow(session)  
-      print("Data exported to {filename}")  
+      import csv
+      fieldnames = ['start_time', 'end_time', 'duration', 'category', 'description']
+      #build every row up front with one C-level itemgetter call each, then hand them over in one batch
+      rows = list(map(itemgetter(*fieldnames), self.get_sessions()))
+      with open(filename, 'w', newline='', buffering=1 << 20) as csvfile: 
+         writer = csv.writer(csvfile) 
+         writer.writerow(fieldnames)
+         writer.writerows(rows)  
+      print(f"Data exported to {filename}")  
    
    def pomodoro_timer(self, duration=25):
-      print("Starting pomodoro timer for {duration} miniutes...") 
-      time.sleep(duration * 60) 
-      print("Pomodoro session completed!") 
+      print(f"Starting pomodoro timer for {duration} minutes...") 
+      #tick against a monotonic deadline so the countdown can't drift and Ctrl+C stops it cleanly
+      deadline = time.monotonic() + duration * 60 
+      try:
+         while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+               break
+            minutes, seconds = divmod(math.ceil(remaining), 60)
+            print(f"\r{minutes:02d}:{seconds:02d} left", end='', flush=True)
+            time.sleep(min(1.0, remaining))
+      except KeyboardInterrupt:
+         print("\nPomodoro stopped early.")
+         return
+      print("\nPomodoro session completed!") 
    
    def set_goal(self, category, hours_per_week):
       self.data['goals'][category] = hours_per_week 
-      self.save_data() 
-      print("Goal set for {category}: {hours_per_week} hours per week") 
+      self._goal_hours[self._category_code(category)] = hours_per_week
+      self.save_goals() 
+      print(f"Goal set for {category}: {hours_per_week} hours per week") 
 
    def get_goals(self):
       return self.data['goals'] 
    
    def track_goals(self):
-      goals = self.get_goals()
-      if not goals:
-         print("No goals set. Use 'set-goals' to set some goals first.") 
+      if not self._goal_hours:
+         print("No goals set. Use 'set_goal' to set some goals first.") 
          return 
       
-      weekly_summary = self.get_summary('weekly') 
+      _, category_time, _ = self._weekly_aggregates(datetime.now().date())
       print("Weekly Goal Tracking:") 
-      for category, goal_hours in goals.item():
-         actual_hours = weekly_summary['category_time'].get(category, 0) 
+      for code, goal_hours in self._goal_hours.items():
+         actual_hours = round(float(category_time[code]), 2) 
          progress = (actual_hours / goal_hours) * 100 if goal_hours > 0 else 0 
-         print("  {category}:") 
-         print("     Goal: {goal_hours} hours") 
-         print("     Actual: {actual_hours} hours") 
-         print("     Progress: {progress:.2f}%") 
+         print(f"  {self._id_to_cat[code]}:") 
+         print(f"     Goal: {goal_hours} hours") 
+         print(f"     Actual: {actual_hours} hours") 
+         print(f"     Progress: {progress:.2f}%") 
    
    def calculate_productivity_score(self):
-      weekly_summary = self.summary('weekly') 
-      total_time = weekly_summary['total_time'] 
-      num_sessions = weekly_summary['num_sessions'] 
+      total_time, _, category_count = self._weekly_aggregates(datetime.now().date())
+      num_sessions = int(sum(category_count))
 
       #simple scoring: 1 point per hour worked 
       base_score = total_time 
       session_bonus = num_sessions * 0.5 
       score =  base_score + session_bonus 
-      return round(score, 2) 
+      return round(float(score), 2) 
    
    def visualize_time_distribution(self):
+      #matplotlib is by far the slowest import, so only plotting pays for it
+      import matplotlib.pyplot as plt 
+      from matplotlib.collections import PolyCollection
+
       summary = self.get_summary() 
-      categories = list(summary['category_time'].keys()) 
-      times = list(summary['category_time'].values()) 
-
-      plt.figure(figsize=(10, 6)) 
-      plt.bar(categories, times) 
-      plt.title('Time Distribution by Category') 
-      plt.xlabel('Categories') 
-      plt.ylabel('Hours') 
-      plt.xticks(rotation=45, ha='right') 
-      plt.tight_layout() 
+      #summaries already list categories tallest first, so the bars come out sorted
+      categories = list(summary['category_time']) 
+      times = np.fromiter(summary['category_time'].values(), dtype=np.float64, count=len(categories)) 
+
+      #every bar goes into a single PolyCollection instead of one Rectangle artist each
+      xs = np.arange(len(times))
+      left, right, bottom = xs - 0.4, xs + 0.4, np.zeros_like(times)
+      verts = np.stack([np.stack([left, left, right, right], axis=1),
+                        np.stack([bottom, times, times, bottom], axis=1)], axis=2)
+
+      fig, ax = plt.subplots(figsize=(10, 6), layout='constrained') 
+      ax.add_collection(PolyCollection(verts, facecolors='C0'))
+      ax.set_xlim(-0.5, max(len(times), 1) - 0.5)
+      ax.set_ylim(0, times.max(initial=0) * 1.05 or 1)
+      ax.set_xticks(xs, categories, rotation=45, ha='right') 
+      ax.set_title('Time Distribution by Category') 
+      ax.set_xlabel('Categories') 
+      ax.set_ylabel('Hours') 
       plt.show() 
 
+def cmd_start(args, tracker):
+   active = tracker.data.get('active')
+   if active:
+      print(f"A session in category '{active['category']}' is already running since {active['start_time']}. End it first.") 
+      return
+   start_dt, category = tracker.start_session(args.category) 
+   print(f"Started session in category '{category}' at {start_dt.isoformat()}") 
+
+def cmd_end(args, tracker):
+   active = tracker.data.get('active')
+   if not active:
+      print("No active session to end. Start a new session first.") 
+   else:
+      #the start has to cross a process boundary, so this is the one place it gets parsed back
+      tracker.end_session(datetime.fromisoformat(active['start_time']), active['category'], args.description) 
+
+def cmd_list(args, tracker):
+   tracker.list_sessions() 
+
+def cmd_total(args, tracker):
+   total_time = tracker.get_total_time()
+   print(f"Total deep work time: {total_time} hours") 
+
+def cmd_summary(args, tracker):
+   summary = tracker.get_summary(args.period) 
+   print(f"Summary for {args.period} period:") 
+   print(f"Total time: {summary['total_time']} hours")
+   print("Time by category:") 
+   for category, hours in summary['category_time'].items():
+      print(f"  {category}: {hours} hours") 
+   print(f"Number of sessions: {summary['num_sessions']}") 
+
+def cmd_export(args, tracker):
+   tracker.export_to_csv(args.filename) 
+
+def cmd_pomodoro(args, tracker):
+   tracker.pomodoro_timer(args.duration) 
+
+def cmd_set_goal(args, tracker):
+   tracker.set_goal(args.category, args.hours) 
+
+def cmd_track_goals(args, tracker):
+   tracker.track_goals() 
+
+def cmd_score(args, tracker):
+   score = tracker.calculate_productivity_score() 
+   print(f"Your current productivity score is: {score}") 
+
+def cmd_visualize(args, tracker):
+   tracker.visualize_time_distribution() 
+
 def main():
+   import argparse 
    parser = argparse.ArgumentParser(description="Deep Work Tracker")
    subparsers = parser.add_subparsers(dest='action', help='Available actions') 
 
    #start session
    start_parser = subparsers.add_parser('start', help='Start a new session') 
    start_parser.add_argument('category', help="Category of the work session") 
+   start_parser.set_defaults(func=cmd_start)
 
    #End session 
    end_parser = subparsers.add_parser('end', help='End the current session') 
    end_parser.add_argument('--description', help="Description of the work session") 
+   end_parser.set_defaults(func=cmd_end)
 
    #List sessions 
-   subparsers.add_parser('list', help='List all sessions') 
+   subparsers.add_parser('list', help='List all sessions').set_defaults(func=cmd_list) 
 
    #Get total time 
-   subparsers.add_parser('total', help='Get total deep work time') 
+   subparsers.add_parser('total', help='Get total deep work time').set_defaults(func=cmd_total) 
 
    #Get summary 
    summary_parser =  subparsers.add_parser('summary', help='Get a summary of deep work sessions') 
    summary_parser.add_argument('--period', choices=['daily', 'weekly', 'all'], default='all', help="Period for summary") 
+   summary_parser.set_defaults(func=cmd_summary)
 
    #Export to csv 
    export_parser = subparsers.add_parser('export', help='Export sessions to CSV') 
    export_parser.add_argument('filename', help="Filename for export") 
+   export_parser.set_defaults(func=cmd_export)
 
    #Pomodoro timer 
    pomodoro_parser = subparsers.add_parser('pomodoro', help='Start a pomodoro timer') 
-   pomodoro_parser.add_argument('--duration', type=int, defualt=25, help="Duration for pomodoro timer(in minutes)") 
+   pomodoro_parser.add_argument('--duration', type=int, default=25, help="Duration for pomodoro timer(in minutes)") 
+   pomodoro_parser.set_defaults(func=cmd_pomodoro)
 
    #Set goal 
    set_goal_parser = subparsers.add_parser('set_goal', help='Set a weekly goal for a category') 
    set_goal_parser.add_argument('category', help="Category for the goal") 
    set_goal_parser.add_argument('hours', type=float, help="Hours per week") 
+   set_goal_parser.set_defaults(func=cmd_set_goal)
 
    #Track goals 
-   subparsers.add_paerser('track_goals', help='Track progress towards goals') 
+   subparsers.add_parser('track_goals', help='Track progress towards goals').set_defaults(func=cmd_track_goals) 
 
    #Get productivity score 
-   subparsers.add_parser('score', help='Calculate productivity score') 
+   subparsers.add_parser('score', help='Calculate productivity score').set_defaults(func=cmd_score) 
 
-   #Visdualize time distribution 
-   subparsers.add_parser('visualize', help='Visualize time distribution by category') 
+   #Visualize time distribution 
+   subparsers.add_parser('visualize', help='Visualize time distribution by category').set_defaults(func=cmd_visualize) 
 
-   args = parser.parser_args() 
+   args = parser.parse_args() 
+   if not hasattr(args, 'func'):
+      parser.print_help()
+      return
    tracker = DeepWorkTracker() 
+   args.func(args, tracker)
 
-   if args.action == 'start':
-      start_time, category = tracker.start_session(args.category) 
-      print("Started session in category '{category}' at {start_time}") 
-   elif args.action =='end':
-      if not tracker.data['sessions'] or 'end_time' in tracker.data['sessions'][-1]:
-         print("No active session to end. Start a new session first.") 
-      else:
-         tracker.end_session(tracker.data['sessions'][-1]['start_time'], tracker.data['sessions'][-1][category], args.description) 
-   elif args.action == 'list':
-      tracker.list_sessions() 
-   elif args.action == 'total':
-      total_time = tracker.get_total_time()
-      print("Total deep work time: {total_time} hours") 
-   elif args.action == 'summary':
-      summary = tracker.get_summary(args.period) 
-      print("Summary for {args.period} period:") 
-      print("Total time: {summary['total_time]} hours")
-      print("Time by category:") 
-      for category, time in summary['category_time'].items():
-         print("  {category}: {time} hours") 
-      print("Number of sessions: {summary['num_sessions']}") 
-   elif args.action == 'export':
-      tracker.export_to_csv(args.filename) 
-   elif args.action == 'pomodoro':
-      tracker.pomodoro_timer(args.duration) 
-   elif args.action == 'set_goal':
-      tracker.set_goal(args.category, args.hours) 
-   elif args.action == 'track_goals':
-      tracker.tracker_goals() 
-   elif args.action == 'score':
-      score = tracker.calculate_productivity_score() 
-      print("Your current productivity score is: {score}") 
-   elif args.action == 'visualize':
-      tracker.visualize_time_distribution() 
\ No newline at end of file
+if __name__ == '__main__':
+   main()